@@ -7,11 +7,52 @@ A web-based interface to organize files in folders by type.
 from flask import Flask, render_template, request, redirect, url_for, flash
 import os
 import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from organizer import organize_files_in_folder
 
 app = Flask(__name__)
 app.secret_key = 'file_organizer_secret_key_2024'  # For flash messages
 
+# Organization runs in the background so a request doesn't pin a worker
+executor = ThreadPoolExecutor(max_workers=4)
+jobs = {}  # job id -> (original_path, folder_path, Future)
+_job_done_at = {}  # job id -> time the job finished (for eviction)
+JOB_RESULT_TTL = 300.0  # seconds a finished but never viewed job is kept
+
+# Recently failed paths (raw input -> (timestamp, error message)) so that
+# resubmitting a bad path answers without touching the filesystem
+_neg_cache = {}
+NEGATIVE_CACHE_TTL = 2.0  # seconds
+NEGATIVE_CACHE_MAX = 128
+
+# Extracts the path from the organizer's "not found" error
+_NOT_FOUND_RE = re.compile(r'Folder does not exist: (.+)')
+
+def _remember_failure(original_path, error_msg):
+    """Store a failed path in the negative cache, dropping expired entries"""
+    now = time.monotonic()
+    if len(_neg_cache) >= NEGATIVE_CACHE_MAX:
+        for path, (timestamp, _) in list(_neg_cache.items()):
+            if now - timestamp >= NEGATIVE_CACHE_TTL:
+                _neg_cache.pop(path, None)
+    _neg_cache[original_path] = (now, error_msg)
+
+def _mark_job_done(job_id):
+    """Return a done-callback that timestamps the job for eviction"""
+    def callback(_future):
+        _job_done_at[job_id] = time.monotonic()
+    return callback
+
+def _evict_finished_jobs():
+    """Drop finished jobs whose result was never viewed (e.g. tab closed)"""
+    now = time.monotonic()
+    for job_id, done_at in list(_job_done_at.items()):
+        if now - done_at >= JOB_RESULT_TTL:
+            jobs.pop(job_id, None)
+            _job_done_at.pop(job_id, None)
+
 @app.route('/')
 def index():
     """Display the main form for folder path input"""
@@ -23,35 +64,63 @@ def organize():
     folder_path = request.form.get('folder_path', '').strip()
     
     # Debug: Show what we received
-    print(f"📥 Received folder path: '{folder_path}'")
+    app.logger.debug("Received folder path: '%s'", folder_path)
     
     # Basic validation
     if not folder_path:
         flash('Please enter a folder path.', 'error')
         return redirect(url_for('index'))
     
+    # Answer repeated submissions of a path that just failed from the cache
+    cached = _neg_cache.get(folder_path)
+    if cached and time.monotonic() - cached[0] < NEGATIVE_CACHE_TTL:
+        flash(cached[1], 'error')
+        return redirect(url_for('index'))
+    
     # Normalize the path (but be more careful about it)
     try:
         # Store original path for comparison
         original_path = folder_path
         folder_path = os.path.abspath(folder_path)
-        print(f"📍 Original path: {original_path}")
-        print(f"📍 Normalized path: {folder_path}")
+        app.logger.debug("Original path: %s", original_path)
+        app.logger.debug("Normalized path: %s", folder_path)
     except Exception as e:
-        print(f"❌ Path normalization failed: {str(e)}")
+        app.logger.debug("Path normalization failed: %s", e)
         flash(f'Invalid folder path: {str(e)}', 'error')
         return redirect(url_for('index'))
     
-    # Debug: Print the path being processed
-    print(f"🔍 Processing folder path: {folder_path}")
-    print(f"📁 Path exists: {os.path.exists(folder_path)}")
-    print(f"📂 Is directory: {os.path.isdir(folder_path)}")
+    # The organizer validates the folder itself (a single stat)
+    app.logger.debug("Processing folder path: %s", folder_path)
+    
+    # Start the organizer in the background and let the status page poll it
+    _evict_finished_jobs()
+    job_id = uuid.uuid4().hex
+    future = executor.submit(organize_files_in_folder, folder_path)
+    jobs[job_id] = (original_path, folder_path, future)
+    future.add_done_callback(_mark_job_done(job_id))
+    return redirect(url_for('status', job_id=job_id))
+
+@app.route('/status/<job_id>')
+def status(job_id):
+    """Show progress of an organization job, or its result once finished"""
+    _evict_finished_jobs()
+    job = jobs.get(job_id)
+    if job is None:
+        flash('Organization job not found. It may have already been displayed.', 'error')
+        return redirect(url_for('index'))
+    
+    original_path, folder_path, future = job
+    if not future.done():
+        return render_template('status.html', folder_path=folder_path)
+    
+    jobs.pop(job_id, None)
+    _job_done_at.pop(job_id, None)
     
-    # Call the organizer function
     try:
-        result = organize_files_in_folder(folder_path)
+        result = future.result()
         
         if result['success']:
+            _neg_cache.pop(original_path, None)
             return render_template('result.html', 
                                  success=True,
                                  folder_path=folder_path,
@@ -65,7 +134,7 @@ def organize():
             error_msg = result["error"]
             if "does not exist" in error_msg:
                 # Extract the path from the error for better guidance
-                path_match = re.search(r'Folder does not exist: (.+)', error_msg)
+                path_match = _NOT_FOUND_RE.search(error_msg)
                 if path_match:
                     invalid_path = path_match.group(1)
                     
@@ -84,6 +153,7 @@ def organize():
                     else:
                         error_msg = f"Folder path not found: {invalid_path}. Please verify the path exists and try again"
             
+            _remember_failure(original_path, error_msg)
             flash(error_msg, 'error')
             return redirect(url_for('index'))
             
@@ -137,4 +207,5 @@ if __name__ == '__main__':
     print("=" * 50)
     
     # Run the Flask app (0.0.0.0 allows external connections for Render.com)
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    # without the debugger/reloader, which slow down every request
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
\ No newline at end of file
@@ -9,74 +9,20 @@ while keeping the script itself safe in its original location.
 
 import os
 import shutil
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from pathlib import Path
 from collections import defaultdict
 
+from organizer import CATEGORIES, EXT_TO_CATEGORY
+
 
 class FileOrganizerBot:
     """Main File Organizer Bot class"""
     
     def __init__(self):
-        # Define file categories and their extensions
-        self.categories = {
-            # Document files
-            'PDFs': ['.pdf'],
-            'Word': ['.doc', '.docx', '.docm', '.dot', '.dotx', '.dotm', '.rtf'],
-            'Excel': ['.xls', '.xlsx', '.xlsm', '.xlsb', '.xlt', '.xltx', '.xltm', '.csv'],
-            'PowerPoint': ['.ppt', '.pptx', '.pptm', '.pot', '.potx', '.potm', '.pps', '.ppsx', '.ppsm'],
-            'Text': ['.txt', '.md', '.rtf', '.log', '.readme'],
-            
-            # Media files
-            'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.svg', '.ico', '.raw', '.cr2', '.nef', '.orf', '.sr2', '.dng', '.heic', '.heif'],
-            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.divx', '.asf', '.rm', '.rmvb', '.vob', '.ts', '.mts', '.m2ts'],
-            'Audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus', '.aiff', '.au', '.ra', '.midi', '.mid', '.ac3', '.dts'],
-            
-            # Archives & Compressed
-            'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.tar.gz', '.tar.bz2', '.tar.xz', '.cab', '.ace', '.arj', '.lzh', '.sit', '.sitx', '.sea'],
-            
-            # Executables & Installers
-            'Executables': ['.exe', '.msi', '.msu', '.deb', '.rpm', '.dmg', '.pkg', '.app', '.appx', '.msix', '.apk', '.ipa', '.run', '.bin', '.com', '.bat', '.cmd', '.sh', '.ps1'],
-            
-            # Programming & Development
-            'Code': ['.py', '.js', '.html', '.htm', '.css', '.php', '.java', '.cpp', '.c', '.h', '.cs', '.rb', '.go', '.rs', '.swift', '.kt', '.scala', '.pl', '.lua', '.r', '.m', '.sql'],
-            'Web': ['.html', '.htm', '.php', '.asp', '.aspx', '.jsp', '.js', '.css', '.scss', '.sass', '.less', '.vue', '.jsx', '.tsx', '.json', '.xml', '.yaml', '.yml'],
-            'Data': ['.json', '.xml', '.yaml', '.yml', '.csv', '.tsv', '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.dbf', '.sav', '.dta'],
-            
-            # Design & Graphics
-            'Design': ['.psd', '.ai', '.eps', '.indd', '.sketch', '.fig', '.xd', '.cdr', '.dwg', '.dxf', '.step', '.iges', '.stl', '.obj', '.fbx', '.blend', '.max', '.ma', '.mb'],
-            
-            # System & Configuration
-            'System': ['.dll', '.sys', '.drv', '.ocx', '.cpl', '.scr', '.vxd', '.inf', '.reg', '.ini', '.cfg', '.conf', '.config', '.properties', '.plist'],
-            
-            # Fonts
-            'Fonts': ['.ttf', '.otf', '.woff', '.woff2', '.eot', '.pfb', '.pfm', '.afm', '.bdf', '.pcf'],
-            
-            # Ebooks
-            'Ebooks': ['.epub', '.mobi', '.azw', '.azw3', '.fb2', '.lit', '.lrf', '.pdb', '.pml', '.rb', '.tcr'],
-            
-            # Disk Images & Virtual
-            'DiskImages': ['.iso', '.img', '.bin', '.nrg', '.mdf', '.cue', '.ccd', '.sub', '.vcd', '.vhd', '.vhdx', '.vmdk', '.vdi', '.qcow2'],
-            
-            # Backup & Temporary
-            'Backup': ['.bak', '.backup', '.old', '.tmp', '.temp', '.swp', '.swo', '.cache', '.dat', '.dmp'],
-            
-            # Certificates & Security
-            'Certificates': ['.crt', '.cer', '.pem', '.key', '.p12', '.pfx', '.jks', '.keystore', '.pub', '.sig'],
-            
-            # CAD & Engineering
-            'CAD': ['.dwg', '.dxf', '.step', '.stp', '.iges', '.igs', '.catpart', '.catproduct', '.prt', '.asm', '.sldprt', '.sldasm', '.slddrw'],
-            
-            # 3D Models
-            '3D_Models': ['.obj', '.fbx', '.dae', '.3ds', '.blend', '.max', '.ma', '.mb', '.stl', '.ply', '.x3d', '.gltf', '.glb'],
-            
-            # Email & Communication
-            'Email': ['.msg', '.eml', '.mbox', '.pst', '.ost', '.dbx', '.mbx', '.emlx'],
-            
-            # Calendar & Contacts
-            'Calendar': ['.ics', '.ical', '.vcs', '.vcf', '.ldif']
-        }
+        self.categories = CATEGORIES
+        self._ext_to_category = EXT_TO_CATEGORY
         
         # Statistics tracking
         self.stats = defaultdict(int)
@@ -110,23 +56,18 @@ class FileOrganizerBot:
     
     def get_file_category(self, file_extension):
         """Determine which category a file belongs to based on its extension"""
-        file_ext = file_extension.lower()
-        
-        for category, extensions in self.categories.items():
-            if file_ext in extensions:
-                return category
-        
-        return 'Others'  # Default category for unmatched files
+        # Default category for unmatched files is 'Others'
+        return self._ext_to_category.get(file_extension.lower(), 'Others')
     
     def create_organized_folders(self, base_path):
         """Create the Organized_Files directory and category subfolders"""
         organized_path = os.path.join(base_path, "Organized_Files")
         
         # Create main organized folder if it doesn't exist
-        if not os.path.exists(organized_path):
+        try:
             os.makedirs(organized_path)
             print(f"📁 Created organized folder: {organized_path}")
-        else:
+        except FileExistsError:
             print(f"📁 Using existing organized folder: {organized_path}")
         
         print("=" * 50)
@@ -142,20 +83,17 @@ class FileOrganizerBot:
             return target_path
         
         # Extract filename parts
-        file_path = Path(target_path)
-        name_without_ext = file_path.stem
-        extension = file_path.suffix
-        parent_dir = file_path.parent
+        parent_dir, name = os.path.split(target_path)
+        name_without_ext, extension = os.path.splitext(name)
         
         # Find unique name with counter
         counter = 1
         while True:
             new_name = f"{name_without_ext}({counter}){extension}"
-            new_path = parent_dir / new_name
+            new_path = os.path.join(parent_dir, new_name)
             
             if not os.path.exists(new_path):
-                print(f"📝 Renamed '{original_filename}' to '{new_name}' (duplicate found)")
-                return str(new_path)
+                return new_path
             
             counter += 1
     
@@ -169,30 +107,37 @@ class FileOrganizerBot:
         self.organized_files_path = organized_path
         
         # Get all files in the selected folder (not subfolders)
+        # (scandir reports the entry type without an extra stat per file)
         try:
-            all_items = os.listdir(folder_path)
+            with os.scandir(folder_path) as it:
+                files = [(entry.name, entry.path) for entry in it
+                        if entry.is_file(follow_symlinks=False)]
         except PermissionError:
             print("❌ Permission denied. Cannot access the selected folder.")
             return False
         
-        # Filter to only include files (not directories)
-        files = [item for item in all_items 
-                if os.path.isfile(os.path.join(folder_path, item))]
-        
         if not files:
             print("📭 No files found in the selected folder.")
             return True
         
         print(f"📊 Found {len(files)} files to organize...")
         
+        # Category folders already created during this run
+        created_dirs = set()
+        
+        # Per-file messages are written in one go at the end
+        log_lines = []
+        
         # Process each file
-        for filename in files:
-            # Skip if file is already in Organized_Files or is a system file
-            if filename.startswith('.') or filename == 'Organized_Files':
+        for filename, file_path in files:
+            # Skip hidden/system files (Organized_Files is a folder, so scandir's
+            # is_file() filter has already excluded it)
+            if filename.startswith('.'):
                 continue
             
-            file_path = os.path.join(folder_path, filename)
-            file_extension = Path(filename).suffix
+            # Extension without building a Path (leading dot is not an extension)
+            dot = filename.rfind('.')
+            file_extension = filename[dot:] if dot > 0 else ''
             
             try:
                 # Determine category
@@ -200,15 +145,22 @@ class FileOrganizerBot:
                 
                 # Create category folder if it doesn't exist
                 category_path = os.path.join(organized_path, category)
-                if not os.path.exists(category_path):
-                    os.makedirs(category_path)
-                    print(f"📁 Created category: {category}")
+                if category_path not in created_dirs:
+                    try:
+                        os.makedirs(category_path)
+                        log_lines.append(f"📁 Created category: {category}")
+                    except FileExistsError:
+                        pass
+                    created_dirs.add(category_path)
                 
                 # Prepare target path
                 target_path = os.path.join(category_path, filename)
                 
                 # Handle duplicates
                 target_path = self.get_unique_filename(target_path, filename)
+                new_name = os.path.basename(target_path)
+                if new_name != filename:
+                    log_lines.append(f"📝 Renamed '{filename}' to '{new_name}' (duplicate found)")
                 
                 # Move the file
                 shutil.move(file_path, target_path)
@@ -217,10 +169,14 @@ class FileOrganizerBot:
                 self.stats[category] += 1
                 self.total_files_moved += 1
                 
-                print(f"✅ Moved '{filename}' → {category}/")
+                log_lines.append(f"✅ Moved '{filename}' → {category}/")
                 
             except Exception as e:
-                print(f"❌ Failed to move '{filename}': {str(e)}")
+                log_lines.append(f"❌ Failed to move '{filename}': {str(e)}")
+        
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            sys.stdout.flush()
         
         return True
     
@@ -4,74 +4,112 @@ File Organizer Core Logic
 Extracted from File Organizer Bot for Flask web interface integration.
 """
 
+import errno
+import json
 import os
 import shutil
-from pathlib import Path
-from collections import defaultdict
+import stat
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Moves are syscall-bound, so larger batches are spread over a thread pool
+MAX_MOVE_WORKERS = 16
+MIN_FILES_FOR_THREADS = 32
+
+
+def _fast_move(src, dst):
+    """Rename src to dst, falling back to a copy across filesystems"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Organized_Files is on another filesystem (e.g. a mount point);
+        # shutil's copy uses sendfile/fcopyfile where the OS supports it
+        try:
+            shutil.copy2(src, dst)
+        except BaseException:
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            raise
+        os.unlink(src)
+
+
+def _move_file(job):
+    """Move a single planned file; returns the job and the error (or None)"""
+    filename, file_path, target_path, category = job
+    try:
+        _fast_move(file_path, target_path)
+        return job, None
+    except Exception as e:
+        return job, e
+
+
+def _stat_dir(path):
+    """Validate a folder with a single stat; returns (stat_result, error message)"""
+    try:
+        st = os.stat(path)
+    except PermissionError:
+        return None, "Permission denied. Cannot access the selected folder."
+    except (OSError, ValueError):
+        return None, f"Folder does not exist: {path}"
+    
+    if not stat.S_ISDIR(st.st_mode):
+        return None, f"Path is not a directory: {path}"
+    
+    return st, None
+
+
+def _load_categories(path):
+    """
+    Load the category table from a JSON file
+    Extensions are lowercased and given a leading dot if it was left out
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"Invalid categories file {path}: line {e.lineno}, column {e.colno}: {e.msg}"
+        ) from e
+    
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid categories file {path}: expected an object of category -> extensions")
+    
+    categories = {}
+    for category, extensions in data.items():
+        if not isinstance(extensions, list) or not all(isinstance(ext, str) for ext in extensions):
+            raise ValueError(f"Invalid categories file {path}: '{category}' must be a list of extensions")
+        categories[category] = tuple(
+            ext.lower() if ext.startswith('.') else '.' + ext.lower()
+            for ext in extensions
+        )
+    return categories
+
+
+def _build_extension_lookup(categories):
+    """Map each extension to its category (first matching category wins)"""
+    ext_to_category = {}
+    for category, extensions in categories.items():
+        for ext in extensions:
+            ext_to_category.setdefault(ext, category)
+    return ext_to_category
+
+
+# File categories and their extensions, loaded once from categories.json
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'categories.json')
+CATEGORIES = _load_categories(CATEGORIES_FILE)
+
+# Extension -> category lookup
+EXT_TO_CATEGORY = _build_extension_lookup(CATEGORIES)
 
 
 class FileOrganizer:
     """Core File Organizer class for web interface"""
     
     def __init__(self):
-        # Define file categories and their extensions
-        self.categories = {
-            # Document files
-            'PDFs': ['.pdf'],
-            'Word': ['.doc', '.docx', '.docm', '.dot', '.dotx', '.dotm', '.rtf'],
-            'Excel': ['.xls', '.xlsx', '.xlsm', '.xlsb', '.xlt', '.xltx', '.xltm', '.csv'],
-            'PowerPoint': ['.ppt', '.pptx', '.pptm', '.pot', '.potx', '.potm', '.pps', '.ppsx', '.ppsm'],
-            'Text': ['.txt', '.md', '.rtf', '.log', '.readme'],
-            
-            # Media files
-            'Images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.svg', '.ico', '.raw', '.cr2', '.nef', '.orf', '.sr2', '.dng', '.heic', '.heif'],
-            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.divx', '.asf', '.rm', '.rmvb', '.vob', '.ts', '.mts', '.m2ts'],
-            'Audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus', '.aiff', '.au', '.ra', '.midi', '.mid', '.ac3', '.dts'],
-            
-            # Archives & Compressed
-            'Archives': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.tar.gz', '.tar.bz2', '.tar.xz', '.cab', '.ace', '.arj', '.lzh', '.sit', '.sitx', '.sea'],
-            
-            # Executables & Installers
-            'Executables': ['.exe', '.msi', '.msu', '.deb', '.rpm', '.dmg', '.pkg', '.app', '.appx', '.msix', '.apk', '.ipa', '.run', '.bin', '.com', '.bat', '.cmd', '.sh', '.ps1'],
-            
-            # Programming & Development
-            'Code': ['.py', '.js', '.html', '.htm', '.css', '.php', '.java', '.cpp', '.c', '.h', '.cs', '.rb', '.go', '.rs', '.swift', '.kt', '.scala', '.pl', '.lua', '.r', '.m', '.sql'],
-            'Web': ['.html', '.htm', '.php', '.asp', '.aspx', '.jsp', '.js', '.css', '.scss', '.sass', '.less', '.vue', '.jsx', '.tsx', '.json', '.xml', '.yaml', '.yml'],
-            'Data': ['.json', '.xml', '.yaml', '.yml', '.csv', '.tsv', '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.dbf', '.sav', '.dta'],
-            
-            # Design & Graphics
-            'Design': ['.psd', '.ai', '.eps', '.indd', '.sketch', '.fig', '.xd', '.cdr', '.dwg', '.dxf', '.step', '.iges', '.stl', '.obj', '.fbx', '.blend', '.max', '.ma', '.mb'],
-            
-            # System & Configuration
-            'System': ['.dll', '.sys', '.drv', '.ocx', '.cpl', '.scr', '.vxd', '.inf', '.reg', '.ini', '.cfg', '.conf', '.config', '.properties', '.plist'],
-            
-            # Fonts
-            'Fonts': ['.ttf', '.otf', '.woff', '.woff2', '.eot', '.pfb', '.pfm', '.afm', '.bdf', '.pcf'],
-            
-            # Ebooks
-            'Ebooks': ['.epub', '.mobi', '.azw', '.azw3', '.fb2', '.lit', '.lrf', '.pdb', '.pml', '.rb', '.tcr'],
-            
-            # Disk Images & Virtual
-            'DiskImages': ['.iso', '.img', '.bin', '.nrg', '.mdf', '.cue', '.ccd', '.sub', '.vcd', '.vhd', '.vhdx', '.vmdk', '.vdi', '.qcow2'],
-            
-            # Backup & Temporary
-            'Backup': ['.bak', '.backup', '.old', '.tmp', '.temp', '.swp', '.swo', '.cache', '.dat', '.dmp'],
-            
-            # Certificates & Security
-            'Certificates': ['.crt', '.cer', '.pem', '.key', '.p12', '.pfx', '.jks', '.keystore', '.pub', '.sig'],
-            
-            # CAD & Engineering
-            'CAD': ['.dwg', '.dxf', '.step', '.stp', '.iges', '.igs', '.catpart', '.catproduct', '.prt', '.asm', '.sldprt', '.sldasm', '.slddrw'],
-            
-            # 3D Models
-            '3D_Models': ['.obj', '.fbx', '.dae', '.3ds', '.blend', '.max', '.ma', '.mb', '.stl', '.ply', '.x3d', '.gltf', '.glb'],
-            
-            # Email & Communication
-            'Email': ['.msg', '.eml', '.mbox', '.pst', '.ost', '.dbx', '.mbx', '.emlx'],
-            
-            # Calendar & Contacts
-            'Calendar': ['.ics', '.ical', '.vcs', '.vcf', '.ldif']
-        }
+        self.categories = CATEGORIES
+        self._ext_to_category = EXT_TO_CATEGORY
         
         # Statistics tracking
         self.stats = defaultdict(int)
@@ -81,161 +119,192 @@ class FileOrganizer:
     
     def get_file_category(self, file_extension):
         """Determine which category a file belongs to based on its extension"""
-        file_ext = file_extension.lower()
-        
-        for category, extensions in self.categories.items():
-            if file_ext in extensions:
-                return category
-        
-        return 'Others'  # Default category for unmatched files
+        # Default category for unmatched files is 'Others'
+        return self._ext_to_category.get(file_extension.lower(), 'Others')
     
     def create_organized_folders(self, base_path):
         """Create the Organized_Files directory and category subfolders"""
         organized_path = os.path.join(base_path, "Organized_Files")
         
         # Create main organized folder if it doesn't exist
-        if not os.path.exists(organized_path):
-            os.makedirs(organized_path)
+        os.makedirs(organized_path, exist_ok=True)
         
         return organized_path
     
-    def get_unique_filename(self, target_path, original_filename):
-        """Generate a unique filename if file already exists"""
-        if not os.path.exists(target_path):
+    def get_unique_filename(self, target_path, original_filename, existing_names=None):
+        """
+        Generate a unique filename if file already exists
+        If existing_names (casefolded names already in the target folder) is
+        given, it is checked instead of the filesystem
+        """
+        if existing_names is None:
+            exists = os.path.exists
+        else:
+            def exists(path):
+                return os.path.basename(path).casefold() in existing_names
+        
+        if not exists(target_path):
             return target_path
         
         # Extract filename parts
-        file_path = Path(target_path)
-        name_without_ext = file_path.stem
-        extension = file_path.suffix
-        parent_dir = file_path.parent
+        parent_dir, name = os.path.split(target_path)
+        name_without_ext, extension = os.path.splitext(name)
         
         # Find unique name with counter
         counter = 1
         while True:
             new_name = f"{name_without_ext}({counter}){extension}"
-            new_path = parent_dir / new_name
+            new_path = os.path.join(parent_dir, new_name)
             
-            if not os.path.exists(new_path):
-                return str(new_path)
+            if not exists(new_path):
+                return new_path
             
             counter += 1
     
+    def _record_run(self, result):
+        """Expose a run's results on the instance and return them"""
+        self.stats = dict(result['stats'])
+        self.total_files_moved = result['total_files']
+        self.organized_files_path = result['organized_path']
+        self.errors = result['errors']
+        return result
+    
     def organize_files_in_folder(self, folder_path):
         """
         Main function to organize files in the specified folder
         Returns a dictionary with results and statistics
         """
-        # Reset stats for this run
-        self.stats = defaultdict(int)
-        self.total_files_moved = 0
-        self.errors = []
+        # Per-run state is kept local so a shared instance can serve
+        # concurrent runs; every return path records its result on the
+        # instance via _record_run
+        moved_categories = []
+        errors = []
         
         # Validate folder path
-        if not os.path.exists(folder_path):
-            return {
+        _, error = _stat_dir(folder_path)
+        if error:
+            return self._record_run({
                 'success': False,
-                'error': f"Folder does not exist: {folder_path}",
+                'error': error,
                 'stats': {},
                 'total_files': 0,
                 'organized_path': '',
                 'errors': []
-            }
-        
-        if not os.path.isdir(folder_path):
-            return {
-                'success': False,
-                'error': f"Path is not a directory: {folder_path}",
-                'stats': {},
-                'total_files': 0,
-                'organized_path': '',
-                'errors': []
-            }
+            })
         
         # Create organized files structure
         try:
             organized_path = self.create_organized_folders(folder_path)
-            self.organized_files_path = organized_path
         except Exception as e:
-            return {
+            return self._record_run({
                 'success': False,
                 'error': f"Failed to create organized folder: {str(e)}",
                 'stats': {},
                 'total_files': 0,
                 'organized_path': '',
                 'errors': []
-            }
+            })
         
         # Get all files in the selected folder (not subfolders)
+        # (scandir reports the entry type without an extra stat per file)
         try:
-            all_items = os.listdir(folder_path)
+            files = []
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        # Lowercased extension, taken once here (a leading
+                        # dot is not an extension)
+                        filename = entry.name
+                        dot = filename.rfind('.')
+                        file_extension = filename[dot:].lower() if dot > 0 else ''
+                        files.append((filename, entry.path, file_extension))
         except PermissionError:
-            return {
+            return self._record_run({
                 'success': False,
                 'error': "Permission denied. Cannot access the selected folder.",
                 'stats': {},
                 'total_files': 0,
                 'organized_path': '',
                 'errors': []
-            }
-        
-        # Filter to only include files (not directories)
-        files = [item for item in all_items 
-                if os.path.isfile(os.path.join(folder_path, item))]
+            })
         
         if not files:
-            return {
+            return self._record_run({
                 'success': True,
                 'message': "No files found in the selected folder.",
                 'stats': {},
                 'total_files': 0,
                 'organized_path': organized_path,
                 'errors': []
-            }
+            })
         
-        # Process each file
-        for filename in files:
-            # Skip if file is already in Organized_Files or is a system file
-            if filename.startswith('.') or filename == 'Organized_Files':
+        # First pass: group files by category
+        groups = defaultdict(list)
+        for filename, file_path, file_extension in files:
+            # Skip hidden/system files (Organized_Files is a folder, so scandir's
+            # is_file() filter has already excluded it)
+            if filename.startswith('.'):
                 continue
             
-            file_path = os.path.join(folder_path, filename)
-            file_extension = Path(filename).suffix
-            
+            category = self._ext_to_category.get(file_extension, 'Others')
+            groups[category].append((filename, file_path))
+        
+        # Second pass: create each category folder once and pick target names.
+        # Jobs stay grouped by category and sorted by name within it, so each
+        # target folder is filled in one contiguous run of inserts.
+        jobs = []
+        for category, items in groups.items():
+            items.sort()
+            category_path = os.path.join(organized_path, category)
             try:
-                # Determine category
-                category = self.get_file_category(file_extension)
-                
-                # Create category folder if it doesn't exist
-                category_path = os.path.join(organized_path, category)
-                if not os.path.exists(category_path):
-                    os.makedirs(category_path)
-                
-                # Prepare target path
-                target_path = os.path.join(category_path, filename)
-                
-                # Handle duplicates
-                target_path = self.get_unique_filename(target_path, filename)
-                
-                # Move the file
-                shutil.move(file_path, target_path)
-                
-                # Update statistics
-                self.stats[category] += 1
-                self.total_files_moved += 1
-                
+                os.makedirs(category_path, exist_ok=True)
+                # Snapshot the folder once instead of probing it per file.
+                # Names are casefolded so case-insensitive filesystems never
+                # get a file overwritten by os.replace.
+                existing_names = {name.casefold() for name in os.listdir(category_path)}
             except Exception as e:
-                error_msg = f"Failed to move '{filename}': {str(e)}"
-                self.errors.append(error_msg)
+                for filename, _ in items:
+                    error_msg = f"Failed to move '{filename}': {str(e)}"
+                    errors.append(error_msg)
+                continue
+            
+            for filename, file_path in items:
+                # Prepare target path, handling duplicates
+                target_path = os.path.join(category_path, filename)
+                target_path = self.get_unique_filename(target_path, filename, existing_names)
+                existing_names.add(os.path.basename(target_path).casefold())
+                jobs.append((filename, file_path, target_path, category))
+        
+        # Third pass: move the files (threaded for larger batches)
+        if len(jobs) < MIN_FILES_FOR_THREADS:
+            results = map(_move_file, jobs)
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_MOVE_WORKERS, len(jobs))) as executor:
+                results = list(executor.map(_move_file, jobs))
+        
+        for (filename, _, _, category), error in results:
+            if error is None:
+                moved_categories.append(category)
+            else:
+                error_msg = f"Failed to move '{filename}': {str(error)}"
+                errors.append(error_msg)
         
-        return {
+        # Update statistics (counted in one pass)
+        stats = dict(Counter(moved_categories))
+        total_files_moved = len(moved_categories)
+        
+        return self._record_run({
             'success': True,
-            'message': f"Successfully organized {self.total_files_moved} files!",
-            'stats': dict(self.stats),
-            'total_files': self.total_files_moved,
+            'message': f"Successfully organized {total_files_moved} files!",
+            'stats': stats,
+            'total_files': total_files_moved,
             'organized_path': organized_path,
-            'errors': self.errors
-        }
+            'errors': errors
+        })
+
+
+# Shared instance used by the convenience function (e.g. per web request)
+_SHARED_ORGANIZER = FileOrganizer()
 
 
 def organize_files_in_folder(folder_path):
@@ -243,8 +312,7 @@ def organize_files_in_folder(folder_path):
     Convenience function to organize files in a folder
     Returns a dictionary with results and statistics
     """
-    organizer = FileOrganizer()
-    return organizer.organize_files_in_folder(folder_path)
+    return _SHARED_ORGANIZER.organize_files_in_folder(folder_path)
 
 
 if __name__ == "__main__":
@@ -5,10 +5,13 @@ Creates sample files and tests the organization functionality
 """
 
 import os
+import errno
 import tempfile
 import shutil
 from pathlib import Path
+from unittest import mock
 from file_organizer_bot import FileOrganizerBot
+import organizer
 
 
 def create_test_files(test_folder):
@@ -175,6 +178,196 @@ def verify_results(test_folder):
     return total_organized > 0
 
 
+def test_fast_move_fallback():
+    """Test the cross-filesystem fallback of organizer._fast_move"""
+    print("\n🧪 Testing cross-filesystem move fallback")
+    print("-" * 40)
+    
+    test_folder = tempfile.mkdtemp(prefix="file_organizer_move_test_")
+    src = os.path.join(test_folder, "report.pdf")
+    dst = os.path.join(test_folder, "moved.pdf")
+    exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+    
+    try:
+        with open(src, 'w', encoding='utf-8') as f:
+            f.write("Test content for report.pdf\n")
+        
+        # A rename across filesystems falls back to copy + unlink
+        with mock.patch.object(organizer.os, 'replace', side_effect=exdev):
+            organizer._fast_move(src, dst)
+        
+        if os.path.exists(src) or not os.path.exists(dst):
+            print("❌ EXDEV fallback did not move the file")
+            return False
+        with open(dst, encoding='utf-8') as f:
+            if f.read() != "Test content for report.pdf\n":
+                print("❌ EXDEV fallback did not preserve the file content")
+                return False
+        print("✅ EXDEV fallback copied the file and removed the source")
+        
+        # A failed copy removes the partial target and keeps the source
+        os.replace(dst, src)
+        
+        def failing_copy(copy_src, copy_dst):
+            with open(copy_dst, 'w', encoding='utf-8') as f:
+                f.write("partial")
+            raise OSError(errno.ENOSPC, "No space left on device")
+        
+        with mock.patch.object(organizer.os, 'replace', side_effect=exdev), \
+                mock.patch.object(organizer.shutil, 'copy2', side_effect=failing_copy):
+            try:
+                organizer._fast_move(src, dst)
+                print("❌ Failed copy did not raise")
+                return False
+            except OSError:
+                pass
+        
+        if os.path.exists(dst) or not os.path.exists(src):
+            print("❌ Failed copy left a partial target or lost the source")
+            return False
+        print("✅ Failed copy cleaned up the partial target")
+        
+        return True
+    
+    finally:
+        shutil.rmtree(test_folder, ignore_errors=True)
+
+
+def test_case_insensitive_duplicates():
+    """Test that organizer.py never overwrites names that differ only in case"""
+    print("\n🧪 Testing case-insensitive duplicate names in organizer.py")
+    print("-" * 40)
+    
+    test_folder = tempfile.mkdtemp(prefix="file_organizer_case_test_")
+    pdf_folder = os.path.join(test_folder, "Organized_Files", "PDFs")
+    existing = {"a.pdf": "existing lowercase\n", "A(1).PDF": "existing uppercase\n"}
+    incoming = {"a.pdf": "incoming lowercase\n", "A.pdf": "incoming uppercase\n"}
+    
+    try:
+        os.makedirs(pdf_folder)
+        for filename, content in existing.items():
+            with open(os.path.join(pdf_folder, filename), 'w', encoding='utf-8') as f:
+                f.write(content)
+        for filename, content in incoming.items():
+            with open(os.path.join(test_folder, filename), 'w', encoding='utf-8') as f:
+                f.write(content)
+        # The source folder may itself be case-insensitive (Windows/macOS)
+        if len([f for f in os.listdir(test_folder) if f.endswith('.pdf')]) != 2:
+            print("⚠️  Skipped: filesystem is case-insensitive, cannot create a.pdf and A.pdf together")
+            return True
+        
+        result = organizer.organize_files_in_folder(test_folder)
+        if result['errors'] or result['total_files'] != 2:
+            print(f"❌ Unexpected result: {result}")
+            return False
+        
+        expected = {
+            "a.pdf": existing["a.pdf"],
+            "A(1).PDF": existing["A(1).PDF"],
+            "A(2).pdf": incoming["A.pdf"],
+            "a(3).pdf": incoming["a.pdf"],
+        }
+        found = {}
+        for filename in os.listdir(pdf_folder):
+            with open(os.path.join(pdf_folder, filename), encoding='utf-8') as f:
+                found[filename] = f.read()
+        
+        if found != expected:
+            print(f"❌ Unexpected PDFs folder contents: {sorted(found)}")
+            return False
+        print("✅ Incoming files renamed to A(2).pdf / a(3).pdf; existing files untouched")
+        
+        return True
+    
+    finally:
+        shutil.rmtree(test_folder, ignore_errors=True)
+
+
+def test_threaded_organizer():
+    """Test organizer.organize_files_in_folder on the threaded move path"""
+    print("\n🧪 Testing threaded moves in organizer.py")
+    print("-" * 40)
+    
+    test_folder = tempfile.mkdtemp(prefix="file_organizer_threaded_test_")
+    extensions = {'.pdf': 'PDFs', '.jpg': 'Images', '.txt': 'Text', '.zip': 'Archives', '.xyz': 'Others'}
+    file_count = organizer.MIN_FILES_FOR_THREADS + 8
+    
+    def create_files():
+        expected = {}
+        ext_list = list(extensions)
+        for i in range(file_count):
+            ext = ext_list[i % len(ext_list)]
+            filename = f"file_{i:03d}{ext}"
+            with open(os.path.join(test_folder, filename), 'w', encoding='utf-8') as f:
+                f.write(f"Test content for {filename}\n")
+            expected[filename] = extensions[ext]
+        return expected
+    
+    def missing_files(expected, organized_path):
+        return [filename for filename, category in expected.items()
+                if not os.path.isfile(os.path.join(organized_path, category, filename))]
+    
+    try:
+        # All files move, and the batch goes through the thread pool
+        expected = create_files()
+        with mock.patch.object(organizer, 'ThreadPoolExecutor',
+                               wraps=organizer.ThreadPoolExecutor) as executor:
+            result = organizer.organize_files_in_folder(test_folder)
+        
+        expected_stats = {}
+        for category in expected.values():
+            expected_stats[category] = expected_stats.get(category, 0) + 1
+        
+        if not executor.called:
+            print(f"❌ {file_count} files did not use the thread pool")
+            return False
+        if not result['success'] or result['errors']:
+            print(f"❌ Organization reported errors: {result.get('error') or result['errors']}")
+            return False
+        if result['stats'] != expected_stats or result['total_files'] != file_count:
+            print(f"❌ Unexpected stats: {result['stats']} ({result['total_files']} files)")
+            return False
+        missing = missing_files(expected, result['organized_path'])
+        if missing:
+            print(f"❌ Files not in their category folder: {missing}")
+            return False
+        print(f"✅ {file_count} files moved across {len(expected_stats)} categories on the thread pool")
+        
+        # One failing move is reported and the other files still move
+        shutil.rmtree(result['organized_path'])
+        expected = create_files()
+        failing_name = "file_000.pdf"
+        real_fast_move = organizer._fast_move
+        
+        def flaky_fast_move(src, dst):
+            if os.path.basename(src) == failing_name:
+                raise OSError(errno.EACCES, "Permission denied")
+            real_fast_move(src, dst)
+        
+        with mock.patch.object(organizer, '_fast_move', side_effect=flaky_fast_move):
+            result = organizer.organize_files_in_folder(test_folder)
+        
+        failed_category = expected.pop(failing_name)
+        expected_stats[failed_category] -= 1
+        
+        if len(result['errors']) != 1 or f"Failed to move '{failing_name}'" not in result['errors'][0]:
+            print(f"❌ Failing move was not reported: {result['errors']}")
+            return False
+        if result['stats'] != expected_stats or result['total_files'] != file_count - 1:
+            print(f"❌ Unexpected stats after a failed move: {result['stats']} ({result['total_files']} files)")
+            return False
+        missing = missing_files(expected, result['organized_path'])
+        if missing or not os.path.isfile(os.path.join(test_folder, failing_name)):
+            print(f"❌ Other files did not move, or the failed file was lost: {missing}")
+            return False
+        print("✅ Failed move reported while the other files still moved")
+        
+        return True
+    
+    finally:
+        shutil.rmtree(test_folder, ignore_errors=True)
+
+
 def main():
     """Main test function"""
     print("🧪 File Organizer Bot - Test Suite")
@@ -198,11 +391,20 @@ def main():
         # Test the organization
         success = test_organization_manually(test_folder)
         
+        # Test the cross-filesystem move fallback
+        fast_move_success = test_fast_move_fallback()
+        
+        # Test the threaded move path of organizer.py
+        threaded_success = test_threaded_organizer()
+        
+        # Test duplicate names that differ only in case
+        case_success = test_case_insensitive_duplicates()
+        
         if success:
             # Verify results
             verification_success = verify_results(test_folder)
             
-            if verification_success:
+            if verification_success and fast_move_success and threaded_success and case_success:
                 print("\n🎉 ALL TESTS PASSED!")
                 print("File Organizer Bot is working correctly.")
             else:
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script for the File Organizer Bot web interface
+Drives the Flask app with its test client and checks the background job flow
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import threading
+from unittest import mock
+
+import app as web_app
+from organizer import organize_files_in_folder
+
+
+def make_folder(base, name):
+    """Create and return a subfolder for one test"""
+    path = os.path.join(base, name)
+    os.makedirs(path)
+    return path
+
+
+def wait_for_job(location):
+    """Wait until the background job behind a /status/<id> URL has finished"""
+    job_id = location.rsplit('/', 1)[-1]
+    job = web_app.jobs.get(job_id)
+    if job is not None:
+        job[2].result(timeout=10)
+
+
+def test_organize_flow(test_folder):
+    """POST /organize -> status page -> result page -> job gone"""
+    print("\n🧪 Testing /organize request flow")
+    print("-" * 40)
+    
+    for filename in ["report.pdf", "photo.jpg", "notes.txt"]:
+        with open(os.path.join(test_folder, filename), 'w', encoding='utf-8') as f:
+            f.write(f"Test content for {filename}\n")
+    
+    client = web_app.app.test_client()
+    
+    # Hold the job until the in-progress page has been checked
+    gate = threading.Event()
+
+    def gated_organize(folder_path):
+        gate.wait(timeout=10)
+        return organize_files_in_folder(folder_path)
+    
+    with mock.patch.object(web_app, 'organize_files_in_folder', gated_organize):
+        response = client.post('/organize', data={'folder_path': test_folder})
+        if response.status_code != 302 or '/status/' not in response.location:
+            print(f"❌ Expected redirect to /status/<id>, got {response.status_code} {response.location}")
+            gate.set()
+            return False
+        status_url = response.location
+        print(f"✅ Redirected to {status_url}")
+    
+        response = client.get(status_url)
+        if response.status_code != 200 or b'Organization in progress' not in response.data:
+            print("❌ Status page did not show the in-progress state")
+            gate.set()
+            return False
+        print("✅ In-progress page shown while the job runs")
+    
+        gate.set()
+        wait_for_job(status_url)
+    
+    response = client.get(status_url)
+    if response.status_code != 200 or b'Successfully organized 3 files!' not in response.data:
+        print("❌ Result page was not shown for the finished job")
+        return False
+    print("✅ Result page shown once the job finished")
+    
+    response = client.get(status_url, follow_redirects=True)
+    if b'Organization job not found' not in response.data:
+        print("❌ Re-polling a displayed job should report it as not found")
+        return False
+    print("✅ Re-polling reports the job as not found")
+    
+    return True
+
+
+def test_negative_cache(test_folder):
+    """A failed path is answered from the cache, and cleared by a success"""
+    print("\n🧪 Testing negative cache for failed paths")
+    print("-" * 40)
+    
+    client = web_app.app.test_client()
+    missing_path = os.path.join(test_folder, "missing")
+    
+    # First submission fails in the background job and is cached
+    response = client.post('/organize', data={'folder_path': missing_path})
+    wait_for_job(response.location)
+    response = client.get(response.location, follow_redirects=True)
+    if b'Folder path not found' not in response.data or missing_path not in web_app._neg_cache:
+        print("❌ Failed path was not reported and cached")
+        return False
+    print("✅ Failed path reported and cached")
+    
+    # Resubmitting within the TTL answers from the cache without a job
+    with mock.patch.object(web_app, 'organize_files_in_folder') as organize:
+        response = client.post('/organize', data={'folder_path': missing_path})
+        if organize.called or '/status/' in response.location:
+            print("❌ Cached failure still started an organization job")
+            return False
+        response = client.get(response.location)
+        if b'Folder path not found' not in response.data:
+            print("❌ Cached error message was not shown")
+            return False
+    print("✅ Resubmission answered from the cache")
+    
+    # Once the entry is stale a new job runs, and its success clears the entry
+    os.makedirs(missing_path)
+    with open(os.path.join(missing_path, "report.pdf"), 'w', encoding='utf-8') as f:
+        f.write("Test content for report.pdf\n")
+    with mock.patch.object(web_app, 'NEGATIVE_CACHE_TTL', 0.0):
+        response = client.post('/organize', data={'folder_path': missing_path})
+        if '/status/' not in response.location:
+            print("❌ Stale cache entry blocked a new job")
+            return False
+        wait_for_job(response.location)
+        client.get(response.location)
+    if missing_path in web_app._neg_cache:
+        print("❌ Successful run did not clear the cache entry")
+        return False
+    print("✅ Successful run cleared the cache entry")
+    
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 File Organizer Bot - Web Interface Test Suite")
+    print("=" * 50)
+    
+    test_folder = tempfile.mkdtemp(prefix="file_organizer_web_test_")
+    print(f"📁 Test directory: {test_folder}")
+    
+    try:
+        results = [
+            test_organize_flow(make_folder(test_folder, "flow")),
+            test_negative_cache(make_folder(test_folder, "negative_cache")),
+        ]
+    finally:
+        shutil.rmtree(test_folder, ignore_errors=True)
+    
+    if all(results):
+        print("\n🎉 ALL TESTS PASSED!")
+    else:
+        print("\n❌ SOME TESTS FAILED!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()